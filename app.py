@@ -1,116 +1,182 @@
 # app.py - Enhanced Website Content Generator with UI/UX
-import gradio as gr
-import json
-import os
-from datetime import datetime
+import asyncio
+import atexit
+import hashlib
+import html
 import logging
-from typing import Dict
+import os
+import re
+import shutil
+import tempfile
+from collections import OrderedDict
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+import jinja2
+import numpy as np
+import openai
+import orjson
+import rcssmin
+import rjsmin
+from markupsafe import Markup
+from starlette.datastructures import Headers
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class ContentGenerator:
-    def __init__(self):
-        self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.mock_mode = not self.openai_api_key
-        if self.mock_mode:
-            logger.warning("OPENAI_API_KEY not found. Using mock responses.")
-    
-    def generate_website_html(self, business_name: str, industry: str, audience: str, keywords: str, tone: str) -> str:
-        """Generate complete HTML website with modern UI/UX"""
-        
-        content_data = self.generate_mock_content_data(business_name, industry, audience, keywords, tone) if self.mock_mode else self.generate_ai_content_data(business_name, industry, audience, keywords, tone)
-        
-        return f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{content_data['page_title']}</title>
-    <meta name="description" content="{content_data['meta_description']}">
-    <meta name="keywords" content="{keywords}">
-    
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-    <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-    
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+# OpenAI settings, read from the environment once at import
+_OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+_OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+_OPENAI_EMBEDDING_MODEL = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+
+# Generation is I/O-bound on the OpenAI call, so let several requests run at once (UI queue and batches alike)
+_GENERATE_CONCURRENCY = 10
+
+# Stylesheet and script for the generated page, minified once at import and spliced into the page template
+_CSS_RAW = """
+        * { margin: 0; padding: 0; box-sizing: border-box; }
         
-        body {{ font-family: 'Inter', sans-serif; line-height: 1.6; color: #333; }}
-        .container {{ max-width: 1200px; margin: 0 auto; padding: 0 20px; }}
+        body { font-family: 'Inter', sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 1200px; margin: 0 auto; padding: 0 20px; }
         
-        header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 1rem 0; position: sticky; top: 0; z-index: 100; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-        nav {{ display: flex; justify-content: space-between; align-items: center; }}
-        .logo {{ font-size: 1.5rem; font-weight: 700; text-decoration: none; color: white; }}
-        .nav-links {{ display: flex; list-style: none; gap: 2rem; }}
-        .nav-links a {{ color: white; text-decoration: none; transition: opacity 0.3s; }}
-        .nav-links a:hover {{ opacity: 0.8; }}
+        header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 1rem 0; position: sticky; top: 0; z-index: 100; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+        nav { display: flex; justify-content: space-between; align-items: center; }
+        .logo { font-size: 1.5rem; font-weight: 700; text-decoration: none; color: white; }
+        .nav-links { display: flex; list-style: none; gap: 2rem; }
+        .nav-links a { color: white; text-decoration: none; transition: opacity 0.3s; }
+        .nav-links a:hover { opacity: 0.8; }
         
-        .hero {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 80px 0; text-align: center; }}
-        .hero h1 {{ font-size: 3rem; font-weight: 700; margin-bottom: 1rem; animation: slideUp 1s ease-out; }}
-        .hero p {{ font-size: 1.25rem; margin-bottom: 2rem; animation: slideUp 1s ease-out 0.3s; }}
+        .hero { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 80px 0; text-align: center; }
+        .hero h1 { font-size: 3rem; font-weight: 700; margin-bottom: 1rem; animation: slideUp 1s ease-out; }
+        .hero p { font-size: 1.25rem; margin-bottom: 2rem; animation: slideUp 1s ease-out 0.3s; }
         
-        .cta-button {{ display: inline-block; background: #ff6b6b; color: white; padding: 15px 30px; text-decoration: none; border-radius: 50px; font-weight: 600; transition: all 0.3s; animation: slideUp 1s ease-out 0.6s; }}
-        .cta-button:hover {{ background: #ff5252; transform: translateY(-2px); box-shadow: 0 5px 15px rgba(255, 107, 107, 0.4); }}
+        .cta-button { display: inline-block; background: #ff6b6b; color: white; padding: 15px 30px; text-decoration: none; border-radius: 50px; font-weight: 600; transition: all 0.3s; animation: slideUp 1s ease-out 0.6s; }
+        .cta-button:hover { background: #ff5252; transform: translateY(-2px); box-shadow: 0 5px 15px rgba(255, 107, 107, 0.4); }
         
-        .section {{ padding: 80px 0; }}
-        .section:nth-child(even) {{ background: #f8f9fa; }}
-        .section h2 {{ text-align: center; font-size: 2.5rem; margin-bottom: 3rem; color: #2c3e50; }}
+        .section { padding: 80px 0; }
+        .section:nth-child(even) { background: #f8f9fa; }
+        .section h2 { text-align: center; font-size: 2.5rem; margin-bottom: 3rem; color: #2c3e50; }
         
-        .about-content {{ display: grid; grid-template-columns: 1fr 1fr; gap: 3rem; align-items: center; }}
-        .about-text {{ font-size: 1.1rem; line-height: 1.8; }}
-        .about-image {{ text-align: center; font-size: 8rem; color: #667eea; opacity: 0.3; }}
+        .about-content { display: grid; grid-template-columns: 1fr 1fr; gap: 3rem; align-items: center; }
+        .about-text { font-size: 1.1rem; line-height: 1.8; }
+        .about-image { text-align: center; font-size: 8rem; color: #667eea; opacity: 0.3; }
         
-        .services-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 2rem; margin-top: 2rem; }}
-        .service-card {{ background: white; padding: 2rem; border-radius: 10px; text-align: center; box-shadow: 0 5px 15px rgba(0,0,0,0.1); transition: transform 0.3s; }}
-        .service-card:hover {{ transform: translateY(-5px); }}
-        .service-icon {{ font-size: 3rem; color: #667eea; margin-bottom: 1rem; }}
-        .service-card h3 {{ font-size: 1.5rem; margin-bottom: 1rem; color: #2c3e50; }}
+        .services-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 2rem; margin-top: 2rem; }
+        .service-card { background: white; padding: 2rem; border-radius: 10px; text-align: center; box-shadow: 0 5px 15px rgba(0,0,0,0.1); transition: transform 0.3s; }
+        .service-card:hover { transform: translateY(-5px); }
+        .service-icon { font-size: 3rem; color: #667eea; margin-bottom: 1rem; }
+        .service-card h3 { font-size: 1.5rem; margin-bottom: 1rem; color: #2c3e50; }
         
-        .features-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 2rem; margin-top: 2rem; }}
-        .feature-item {{ display: flex; align-items: center; gap: 1rem; }}
-        .feature-icon {{ font-size: 2rem; color: #667eea; min-width: 60px; }}
-        .feature-text h4 {{ font-size: 1.2rem; margin-bottom: 0.5rem; color: #2c3e50; }}
+        .features-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 2rem; margin-top: 2rem; }
+        .feature-item { display: flex; align-items: center; gap: 1rem; }
+        .feature-icon { font-size: 2rem; color: #667eea; min-width: 60px; }
+        .feature-text h4 { font-size: 1.2rem; margin-bottom: 0.5rem; color: #2c3e50; }
         
-        .contact-content {{ display: grid; grid-template-columns: 1fr 1fr; gap: 3rem; }}
-        .contact-info {{ background: white; padding: 2rem; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); }}
-        .contact-item {{ display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem; }}
-        .contact-icon {{ font-size: 1.5rem; color: #667eea; min-width: 40px; }}
+        .contact-content { display: grid; grid-template-columns: 1fr 1fr; gap: 3rem; }
+        .contact-info { background: white; padding: 2rem; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); }
+        .contact-item { display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem; }
+        .contact-icon { font-size: 1.5rem; color: #667eea; min-width: 40px; }
         
-        .contact-form {{ background: white; padding: 2rem; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); }}
-        .form-group {{ margin-bottom: 1.5rem; }}
-        .form-group label {{ display: block; margin-bottom: 0.5rem; font-weight: 500; color: #2c3e50; }}
-        .form-group input, .form-group textarea {{ width: 100%; padding: 12px; border: 1px solid #ddd; border-radius: 5px; font-size: 1rem; transition: border-color 0.3s; }}
-        .form-group input:focus, .form-group textarea:focus {{ outline: none; border-color: #667eea; }}
+        .contact-form { background: white; padding: 2rem; border-radius: 10px; box-shadow: 0 5px 15px rgba(0,0,0,0.1); }
+        .form-group { margin-bottom: 1.5rem; }
+        .form-group label { display: block; margin-bottom: 0.5rem; font-weight: 500; color: #2c3e50; }
+        .form-group input, .form-group textarea { width: 100%; padding: 12px; border: 1px solid #ddd; border-radius: 5px; font-size: 1rem; transition: border-color 0.3s; }
+        .form-group input:focus, .form-group textarea:focus { outline: none; border-color: #667eea; }
         
-        .submit-btn {{ background: #667eea; color: white; padding: 12px 30px; border: none; border-radius: 5px; font-size: 1rem; cursor: pointer; transition: background 0.3s; }}
-        .submit-btn:hover {{ background: #5a6fd8; }}
+        .submit-btn { background: #667eea; color: white; padding: 12px 30px; border: none; border-radius: 5px; font-size: 1rem; cursor: pointer; transition: background 0.3s; }
+        .submit-btn:hover { background: #5a6fd8; }
         
-        footer {{ background: #2c3e50; color: white; padding: 3rem 0 1rem; text-align: center; }}
-        .footer-content {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 2rem; margin-bottom: 2rem; }}
-        .footer-section h3 {{ margin-bottom: 1rem; color: #667eea; }}
-        .footer-section ul {{ list-style: none; }}
-        .footer-section ul li {{ margin-bottom: 0.5rem; }}
-        .footer-section ul li a {{ color: #bdc3c7; text-decoration: none; transition: color 0.3s; }}
-        .footer-section ul li a:hover {{ color: white; }}
-        .footer-bottom {{ border-top: 1px solid #34495e; padding-top: 1rem; color: #bdc3c7; }}
+        footer { background: #2c3e50; color: white; padding: 3rem 0 1rem; text-align: center; }
+        .footer-content { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 2rem; margin-bottom: 2rem; }
+        .footer-section h3 { margin-bottom: 1rem; color: #667eea; }
+        .footer-section ul { list-style: none; }
+        .footer-section ul li { margin-bottom: 0.5rem; }
+        .footer-section ul li a { color: #bdc3c7; text-decoration: none; transition: color 0.3s; }
+        .footer-section ul li a:hover { color: white; }
+        .footer-bottom { border-top: 1px solid #34495e; padding-top: 1rem; color: #bdc3c7; }
         
-        @keyframes slideUp {{ from {{ opacity: 0; transform: translateY(30px); }} to {{ opacity: 1; transform: translateY(0); }} }}
+        @keyframes slideUp { from { opacity: 0; transform: translateY(30px); } to { opacity: 1; transform: translateY(0); } }
         
-        @media (max-width: 768px) {{
-            .nav-links {{ display: none; }}
-            .hero h1 {{ font-size: 2rem; }}
-            .about-content, .contact-content {{ grid-template-columns: 1fr; }}
-            .services-grid {{ grid-template-columns: 1fr; }}
-        }}
+        @media (max-width: 768px) {
+            .nav-links { display: none; }
+            .hero h1 { font-size: 2rem; }
+            .about-content, .contact-content { grid-template-columns: 1fr; }
+            .services-grid { grid-template-columns: 1fr; }
+        }
+"""
+
+_JS_RAW = """
+        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+            anchor.addEventListener('click', function (e) {
+                e.preventDefault();
+                document.querySelector(this.getAttribute('href')).scrollIntoView({
+                    behavior: 'smooth'
+                });
+            });
+        });
+
+        document.querySelector('.contact-form').addEventListener('submit', function(e) {
+            e.preventDefault();
+            alert('Thank you for your message! We will get back to you soon.');
+            this.reset();
+        });
+
+        const observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    entry.target.style.opacity = '1';
+                    entry.target.style.transform = 'translateY(0)';
+                }
+            });
+        }, {threshold: 0.1});
+
+        document.querySelectorAll('.service-card').forEach(card => {
+            card.style.opacity = '0';
+            card.style.transform = 'translateY(30px)';
+            card.style.transition = 'all 0.6s ease-out';
+            observer.observe(card);
+        });
+"""
+
+_CSS = Markup(rcssmin.cssmin(_CSS_RAW))
+_JS = Markup(rjsmin.jsmin(_JS_RAW))
+
+# Static page skeleton, compiled once at import; only the placeholders are filled per request
+_TEMPLATE_SOURCE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ page_title }}</title>
+    <meta name="description" content="{{ meta_description }}">
+    <meta name="keywords" content="{{ keywords }}">
+    
+    <link rel="preconnect" href="https://fonts.googleapis.com" crossorigin>
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
+    <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" media="print" onload="this.media='all'">
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" media="print" onload="this.media='all'">
+    <noscript>
+        <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap">
+        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
+    </noscript>
+    
+    <style>
+        {{ css }}
     </style>
 </head>
 <body>
     <header>
         <nav class="container">
-            <a href="#" class="logo">{business_name}</a>
+            <a href="#" class="logo">{{ business_name }}</a>
             <ul class="nav-links">
                 <li><a href="#home">Home</a></li>
                 <li><a href="#about">About</a></li>
@@ -122,18 +188,18 @@ class ContentGenerator:
 
     <section class="hero" id="home">
         <div class="container">
-            <h1>{content_data['main_headline']}</h1>
-            <p>{content_data['subheadline']}</p>
-            <a href="#contact" class="cta-button">{content_data['cta_text']}</a>
+            <h1>{{ main_headline }}</h1>
+            <p>{{ subheadline }}</p>
+            <a href="#contact" class="cta-button">{{ cta_text }}</a>
         </div>
     </section>
 
     <section class="section" id="about">
         <div class="container">
-            <h2>About {business_name}</h2>
+            <h2>About {{ business_name }}</h2>
             <div class="about-content">
                 <div class="about-text">
-                    <p>{content_data['about_text']}</p>
+                    <p>{{ about_text }}</p>
                 </div>
                 <div class="about-image">
                     <i class="fas fa-building"></i>
@@ -146,16 +212,16 @@ class ContentGenerator:
         <div class="container">
             <h2>Our Services</h2>
             <div class="services-grid">
-                {self.generate_service_cards(content_data['services'])}
+                {{ services_html }}
             </div>
         </div>
     </section>
 
     <section class="section">
         <div class="container">
-            <h2>Why Choose {business_name}?</h2>
+            <h2>Why Choose {{ business_name }}?</h2>
             <div class="features-grid">
-                {self.generate_feature_items(content_data['features'])}
+                {{ features_html }}
             </div>
         </div>
     </section>
@@ -184,7 +250,7 @@ class ContentGenerator:
                         <i class="fas fa-envelope contact-icon"></i>
                         <div>
                             <h4>Email</h4>
-                            <p>info@{business_name.lower().replace(' ', '')}.com</p>
+                            <p>info@{{ slug }}.com</p>
                         </div>
                     </div>
                 </div>
@@ -211,8 +277,8 @@ class ContentGenerator:
         <div class="container">
             <div class="footer-content">
                 <div class="footer-section">
-                    <h3>{business_name}</h3>
-                    <p>Your trusted partner in {industry.lower()}. We're committed to delivering exceptional results.</p>
+                    <h3>{{ business_name }}</h3>
+                    <p>Your trusted partner in {{ industry|lower }}. We're committed to delivering exceptional results.</p>
                 </div>
                 <div class="footer-section">
                     <h3>Quick Links</h3>
@@ -227,216 +293,603 @@ class ContentGenerator:
                     <h3>Contact Info</h3>
                     <ul>
                         <li><i class="fas fa-phone"></i> (555) 123-4567</li>
-                        <li><i class="fas fa-envelope"></i> info@{business_name.lower().replace(' ', '')}.com</li>
+                        <li><i class="fas fa-envelope"></i> info@{{ slug }}.com</li>
                         <li><i class="fas fa-map-marker-alt"></i> 123 Business Street, City</li>
                     </ul>
                 </div>
             </div>
             <div class="footer-bottom">
-                <p>&copy; {datetime.now().year} {business_name}. All rights reserved.</p>
+                <p>&copy; {{ year }} {{ business_name }}. All rights reserved.</p>
             </div>
         </div>
     </footer>
 
     <script>
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
-            anchor.addEventListener('click', function (e) {{
-                e.preventDefault();
-                document.querySelector(this.getAttribute('href')).scrollIntoView({{
-                    behavior: 'smooth'
-                }});
-            }});
-        }});
-
-        document.querySelector('.contact-form').addEventListener('submit', function(e) {{
-            e.preventDefault();
-            alert('Thank you for your message! We will get back to you soon.');
-            this.reset();
-        }});
-
-        const observer = new IntersectionObserver((entries) => {{
-            entries.forEach(entry => {{
-                if (entry.isIntersecting) {{
-                    entry.target.style.opacity = '1';
-                    entry.target.style.transform = 'translateY(0)';
-                }}
-            }});
-        }}, {{threshold: 0.1}});
-
-        document.querySelectorAll('.service-card').forEach(card => {{
-            card.style.opacity = '0';
-            card.style.transform = 'translateY(30px)';
-            card.style.transition = 'all 0.6s ease-out';
-            observer.observe(card);
-        }});
+        {{ js }}
     </script>
 </body>
 </html>"""
+
+# Whitespace between tags is layout-only in the generated page (inline CSS/JS are already minified)
+_INTER_TAG_WHITESPACE = re.compile(r">\s+<")
+
+def _finalize_html(html_content: str) -> str:
+    """Drop inter-tag whitespace so less HTML is stored, cached and sent to the browser"""
+    return _INTER_TAG_WHITESPACE.sub("><", html_content).strip()
+
+# Compiled template bytecode is kept on disk so restarts skip recompiling; Jinja keys entries on the source checksum.
+# Unless JINJA_CACHE_DIR names an existing directory, Jinja uses its private per-user temp directory (mode 0700, owner checked)
+_TEMPLATE_ENV = jinja2.Environment(
+    loader=jinja2.DictLoader({"website.html": _TEMPLATE_SOURCE}),
+    bytecode_cache=jinja2.FileSystemBytecodeCache(os.getenv("JINJA_CACHE_DIR")),
+    auto_reload=False,
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True
+)
+_WEBSITE_TEMPLATE = _TEMPLATE_ENV.get_template("website.html")
+
+# Card fragments for the services/features grids
+_SERVICE_TMPL = '''<div class="service-card">
+                <div class="service-icon"><i class="{icon}"></i></div>
+                <h3>{title}</h3>
+                <p>{desc}</p>
+            </div>'''
+
+_FEATURE_TMPL = '''<div class="feature-item">
+                <div class="feature-icon"><i class="{icon}"></i></div>
+                <div class="feature-text">
+                    <h4>{title}</h4>
+                    <p>{desc}</p>
+                </div>
+            </div>'''
+
+# Content data is generated without the business name so near-identical requests share cache entries;
+# the name is written as this token and filled in by _fill_business_name at render time
+_NAME_TOKEN = "[BUSINESS_NAME]"
+# Also matches the spellings models drift into, e.g. "[Business Name]" or "[business_name]"
+_NAME_TOKEN_RE = re.compile(r"\[\s*business[\s_-]*name\s*\]", re.IGNORECASE)
+
+def _fill_business_name(content_data: Mapping, business_name: str) -> Dict:
+    """Return a copy of content_data with the name token replaced in every text field"""
+    def fill(value):
+        return _NAME_TOKEN_RE.sub(lambda _: business_name, value) if isinstance(value, str) else value
+    
+    filled = {key: fill(value) for key, value in content_data.items()}
+    for key in ('services', 'features'):
+        filled[key] = [{k: fill(v) for k, v in item.items()} for item in content_data.get(key, ())]
+    return filled
+
+# Static service/feature copy shared by every mock page
+_MOCK_SERVICES = (
+    {'title': 'Professional Consultation', 'description': 'Expert advice tailored to your specific needs and goals.'},
+    {'title': 'Custom Solutions', 'description': 'Personalized approaches designed to address your unique challenges.'},
+    {'title': 'Ongoing Support', 'description': '24/7 customer support to ensure your continued success.'},
+    {'title': 'Strategic Planning', 'description': 'Long-term strategies that align with your business objectives.'},
+)
+_MOCK_FEATURES = (
+    {'title': 'Proven Experience', 'description': 'Years of expertise with a track record of success.'},
+    {'title': 'Quality Assurance', 'description': 'Rigorous quality control processes ensure exceptional results.'},
+    {'title': 'Customer-Centric', 'description': 'Your success is our priority in everything we do.'},
+    {'title': 'Innovation Focus', 'description': 'Cutting-edge solutions that keep you ahead of the competition.'},
+)
+
+@lru_cache(maxsize=128)
+def _mock_content(industry: str, audience: str, keywords: str, tone: str) -> Mapping:
+    """Build (and memoize) the mock content for a set of inputs; read-only since it is shared between calls"""
+    business_name = _NAME_TOKEN
+    return MappingProxyType({
+        'page_title': f"{business_name} - Leading {industry} Solutions",
+        'meta_description': f"Discover {business_name}, your trusted partner in {industry}. We serve {audience} with professional excellence.",
+        'main_headline': f"Welcome to {business_name}",
+        'subheadline': f"Your trusted partner in {industry}, dedicated to serving {audience} with excellence and innovation.",
+        'about_text': f"{business_name} is a leading company in the {industry} industry, committed to delivering exceptional results for {audience}. Our team combines years of experience with cutting-edge technology to provide solutions that drive success.",
+        'cta_text': "Get Started Today",
+        'services': _MOCK_SERVICES,
+        'features': _MOCK_FEATURES
+    })
+
+_MISSING_BUSINESS_NAME = "❌ Please enter a business name."
+_MISSING_INDUSTRY = "❌ Please enter an industry."
+
+def _nonblank(s: str) -> bool:
+    """True if s has any non-whitespace character (checked without building a stripped copy)"""
+    return bool(s) and not s.isspace()
+
+# Text fields every AI response must provide, alongside the services/features lists
+_AI_TEXT_FIELDS = ('page_title', 'meta_description', 'main_headline', 'subheadline', 'about_text', 'cta_text')
+
+def _valid_ai_content(data) -> bool:
+    """True if parsed AI output has the shape the page template expects (checked before anything is cached)"""
+    if not isinstance(data, dict) or not all(isinstance(data.get(key), str) for key in _AI_TEXT_FIELDS):
+        return False
+    # Content that never names the business would render without it, so it is rejected like a malformed response
+    if not any(_NAME_TOKEN_RE.search(data[key]) for key in _AI_TEXT_FIELDS):
+        return False
+    return all(
+        isinstance(data.get(key), list) and all(
+            isinstance(item, dict) and isinstance(item.get('title'), str) and isinstance(item.get('description'), str)
+            for item in data[key]
+        )
+        for key in ('services', 'features')
+    )
+
+# On-disk cache of parsed OpenAI responses, one JSON file per SHA-256 of (model, prompt)
+_AI_CACHE_DIR = Path(os.getenv("AI_CACHE_DIR", ".ai_cache"))
+# Keys hash free-text user input, so the cache is capped; the oldest entries (by mtime) are evicted past this size
+_AI_CACHE_SIZE_LIMIT = 64 << 20
+
+def _ai_cache_get(key: str):
+    """Return cached AI content for key, or None on a miss"""
+    try:
+        return orjson.loads((_AI_CACHE_DIR / f"{key}.json").read_bytes())
+    except (OSError, ValueError):
+        return None
+
+def _ai_cache_set(key: str, data: Dict) -> None:
+    """Store AI content for key; cache write failures are logged and otherwise ignored"""
+    path = _AI_CACHE_DIR / f"{key}.json"
+    try:
+        _AI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(data))
+        tmp_path.replace(path)
+        _ai_cache_prune()
+    except OSError as e:
+        logger.warning(f"Could not write AI cache entry: {e}")
+
+def _ai_cache_prune() -> None:
+    """Delete the oldest cache entries until the cache fits in _AI_CACHE_SIZE_LIMIT bytes"""
+    entries = []
+    for path in _AI_CACHE_DIR.glob("*.json"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= _AI_CACHE_SIZE_LIMIT:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+# In-memory LRU of fully rendered pages, keyed on the form inputs
+_HTML_CACHE: "OrderedDict[tuple, str]" = OrderedDict()
+_HTML_CACHE_SIZE = 256
+
+def _html_cache_get(key: tuple):
+    """Return the cached page for key (marking it recently used), or None on a miss"""
+    html_content = _HTML_CACHE.get(key)
+    if html_content is not None:
+        _HTML_CACHE.move_to_end(key)
+    return html_content
+
+def _html_cache_set(key: tuple, html_content: str) -> None:
+    """Store a rendered page, evicting the least recently used one when full"""
+    _HTML_CACHE[key] = html_content
+    _HTML_CACHE.move_to_end(key)
+    if len(_HTML_CACHE) > _HTML_CACHE_SIZE:
+        _HTML_CACHE.popitem(last=False)
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=8),
+    retry=retry_if_exception_type((openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)),
+    reraise=True
+)
+async def _call_openai(client, body: Dict) -> str:
+    """Stream a chat completion and return its text, retrying transient API errors with backoff"""
+    # Streaming keeps the event loop free while tokens arrive
+    stream = await client.chat.completions.create(**body, stream=True)
+    parts = []
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            parts.append(chunk.choices[0].delta.content)
+    return "".join(parts)
+
+class SemanticCache:
+    """Nearest-neighbour cache of AI content keyed by prompt embeddings (brute-force cosine similarity)
+
+    Entries live in memory only and are partitioned, e.g. by tone, so a near match never crosses partitions.
+    """
+    def __init__(self, threshold: float = 0.95, max_entries: int = 1024):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._vectors: Dict[str, np.ndarray] = {}
+        self._values: Dict[str, List[Dict]] = {}
+    
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        return vector / (np.linalg.norm(vector) or 1.0)
+    
+    def lookup(self, partition: str, embedding: List[float]):
+        """Return the closest cached content in partition if it is similar enough, else None"""
+        values = self._values.get(partition)
+        if not values:
+            return None
+        scores = self._vectors[partition] @ self._normalize(embedding)
+        best = int(np.argmax(scores))
+        return values[best] if scores[best] >= self.threshold else None
+    
+    def add(self, partition: str, embedding: List[float], data: Dict) -> None:
+        """Remember content for an embedding in partition, dropping the partition's oldest entry when full"""
+        vector = self._normalize(embedding)[np.newaxis, :]
+        values = self._values.get(partition, [])
+        self._vectors[partition] = vector if not values else np.vstack([self._vectors[partition], vector])[-self.max_entries:]
+        self._values[partition] = (values + [data])[-self.max_entries:]
+
+class ContentGenerator:
+    __slots__ = ("openai_api_key", "mock_mode", "_client", "_semantic_cache")
+    
+    # Both icon tuples have 4 entries, so cards index them with i & 3
+    _SERVICE_ICONS = ("fas fa-cogs", "fas fa-users", "fas fa-chart-line", "fas fa-lightbulb")
+    _FEATURE_ICONS = ("fas fa-check-circle", "fas fa-star", "fas fa-shield-alt", "fas fa-rocket")
+    
+    def __init__(self):
+        self.openai_api_key = _OPENAI_API_KEY
+        self.mock_mode = not self.openai_api_key
+        self._client = None
+        if self.mock_mode:
+            logger.warning("OPENAI_API_KEY not found. Using mock responses.")
+        else:
+            # One client for the app's lifetime so its connection pool is reused; retries are handled by _call_openai
+            try:
+                self._client = openai.AsyncOpenAI(api_key=self.openai_api_key, timeout=30.0, max_retries=0)
+            except Exception as e:
+                # Built at import, so a failure here (e.g. an incompatible httpx) must not take the app down
+                logger.error(f"Could not create OpenAI client: {e}. Using mock responses.")
+                self.mock_mode = True
+        self._semantic_cache = SemanticCache()
+    
+    async def generate_website_html(self, business_name: str, industry: str, audience: str, keywords: str, tone: str, year: Optional[int] = None) -> str:
+        """Generate complete HTML website with modern UI/UX; the output depends only on the arguments when year is given"""
+        
+        content_data = self.generate_mock_content_data(industry, audience, keywords, tone) if self.mock_mode else await self.generate_ai_content_data(industry, audience, keywords, tone)
+        return self.render_website_html(business_name, industry, keywords, content_data, year or date.today().year)
+    
+    def render_website_html(self, business_name: str, industry: str, keywords: str, content_data: Mapping, year: int) -> str:
+        """Fill the business name into content_data and render the finished page"""
+        content_data = _fill_business_name(content_data, business_name)
+        return _finalize_html("".join(self.render_website_chunks(business_name, industry, keywords, content_data, year)))
+    
+    def render_website_chunks(self, business_name: str, industry: str, keywords: str, content_data: Mapping, year: int) -> Iterator[str]:
+        """Render the page section by section, e.g. for a streaming response; chunks are raw template output, so
+        apply _finalize_html to the joined chunks to get the same bytes as generate_website_html"""
+        # The template autoescapes user/AI text; only the prebuilt fragments are marked safe
+        return _WEBSITE_TEMPLATE.generate(
+            content_data,
+            business_name=business_name,
+            industry=industry,
+            keywords=keywords,
+            slug=business_name.lower().replace(' ', ''),
+            year=year,
+            css=_CSS,
+            js=_JS,
+            services_html=Markup(self.generate_service_cards(content_data['services'])),
+            features_html=Markup(self.generate_feature_items(content_data['features'])),
+        )
     
     def generate_service_cards(self, services):
         """Generate HTML for service cards"""
-        icons = ["fas fa-cogs", "fas fa-users", "fas fa-chart-line", "fas fa-lightbulb"]
-        return "".join([
-            f'''<div class="service-card">
-                <div class="service-icon"><i class="{icons[i % len(icons)]}"></i></div>
-                <h3>{service['title']}</h3>
-                <p>{service['description']}</p>
-            </div>''' for i, service in enumerate(services)
-        ])
+        return "".join(
+            _SERVICE_TMPL.format(icon=self._SERVICE_ICONS[i & 3], title=html.escape(service['title']), desc=html.escape(service['description']))
+            for i, service in enumerate(services)
+        )
     
     def generate_feature_items(self, features):
         """Generate HTML for feature items"""
-        icons = ["fas fa-check-circle", "fas fa-star", "fas fa-shield-alt", "fas fa-rocket"]
-        return "".join([
-            f'''<div class="feature-item">
-                <div class="feature-icon"><i class="{icons[i % len(icons)]}"></i></div>
-                <div class="feature-text">
-                    <h4>{feature['title']}</h4>
-                    <p>{feature['description']}</p>
-                </div>
-            </div>''' for i, feature in enumerate(features)
-        ])
+        return "".join(
+            _FEATURE_TMPL.format(icon=self._FEATURE_ICONS[i & 3], title=html.escape(feature['title']), desc=html.escape(feature['description']))
+            for i, feature in enumerate(features)
+        )
     
-    def generate_mock_content_data(self, business_name: str, industry: str, audience: str, keywords: str, tone: str) -> Dict:
+    def generate_mock_content_data(self, industry: str, audience: str, keywords: str, tone: str) -> Mapping:
         """Generate mock content data structure"""
-        return {
-            'page_title': f"{business_name} - Leading {industry} Solutions",
-            'meta_description': f"Discover {business_name}, your trusted partner in {industry}. We serve {audience} with professional excellence.",
-            'main_headline': f"Welcome to {business_name}",
-            'subheadline': f"Your trusted partner in {industry}, dedicated to serving {audience} with excellence and innovation.",
-            'about_text': f"{business_name} is a leading company in the {industry} industry, committed to delivering exceptional results for {audience}. Our team combines years of experience with cutting-edge technology to provide solutions that drive success.",
-            'cta_text': "Get Started Today",
-            'services': [
-                {'title': 'Professional Consultation', 'description': 'Expert advice tailored to your specific needs and goals.'},
-                {'title': 'Custom Solutions', 'description': 'Personalized approaches designed to address your unique challenges.'},
-                {'title': 'Ongoing Support', 'description': '24/7 customer support to ensure your continued success.'},
-                {'title': 'Strategic Planning', 'description': 'Long-term strategies that align with your business objectives.'}
-            ],
-            'features': [
-                {'title': 'Proven Experience', 'description': 'Years of expertise with a track record of success.'},
-                {'title': 'Quality Assurance', 'description': 'Rigorous quality control processes ensure exceptional results.'},
-                {'title': 'Customer-Centric', 'description': 'Your success is our priority in everything we do.'},
-                {'title': 'Innovation Focus', 'description': 'Cutting-edge solutions that keep you ahead of the competition.'}
-            ]
+        return _mock_content(industry, audience, keywords, tone)
+    
+    def build_ai_request(self, industry: str, audience: str, keywords: str, tone: str) -> Tuple[str, Dict]:
+        """Build the cache key and chat completion body for a set of inputs"""
+        prompt = f"""Generate website content for a business in {industry} targeting {audience}. 
+        Write {_NAME_TOKEN} wherever the business name should appear. 
+        Keywords: {keywords}. Tone: {tone}. Return JSON with: page_title, meta_description, main_headline, 
+        subheadline, about_text, cta_text, services array (4 items), features array (4 items)."""
+        
+        model = _OPENAI_MODEL
+        cache_key = hashlib.sha256(f"{model}\n{prompt}".encode()).hexdigest()
+        body = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "response_format": {"type": "json_object"},
+            "max_tokens": 900,
+            "temperature": 0.3
         }
+        return cache_key, body
     
-    def generate_ai_content_data(self, business_name: str, industry: str, audience: str, keywords: str, tone: str) -> Dict:
-        """Generate AI-powered content data structure"""
+    async def embed_inputs(self, industry: str, audience: str, keywords: str):
+        """Embed the content inputs for the semantic cache (tone is matched exactly instead); returns None if the embedding call fails"""
         try:
-            from openai import OpenAI
-            client = OpenAI(api_key=self.openai_api_key)
-            
-            prompt = f"""Generate website content for {business_name} in {industry} targeting {audience}. 
-            Keywords: {keywords}. Tone: {tone}. Return JSON with: page_title, meta_description, main_headline, 
-            subheadline, about_text, cta_text, services array (4 items), features array (4 items)."""
-            
-            response = client.chat.completions.create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=2000,
-                temperature=0.7
+            response = await self._client.embeddings.create(
+                model=_OPENAI_EMBEDDING_MODEL,
+                input=f"{industry}|{audience}|{keywords}"
             )
+            return response.data[0].embedding
+        except Exception as e:
+            logger.warning(f"Could not embed inputs for semantic cache: {e}")
+            return None
+    
+    async def generate_ai_content_data(self, industry: str, audience: str, keywords: str, tone: str) -> Mapping:
+        """Generate AI-powered content data structure, falling back to mock content if that fails"""
+        data = await self._fetch_ai_content_data(industry, audience, keywords, tone)
+        return data if data is not None else self.generate_mock_content_data(industry, audience, keywords, tone)
+    
+    async def _fetch_ai_content_data(self, industry: str, audience: str, keywords: str, tone: str) -> Optional[Dict]:
+        """Return AI content from the caches or the API, or None if the API call fails or returns unusable content"""
+        try:
+            cache_key, body = self.build_ai_request(industry, audience, keywords, tone)
+            cached = _ai_cache_get(cache_key)
+            if cached is not None and _valid_ai_content(cached):
+                logger.info(f"AI content cache hit for {industry}")
+                return cached
+            
+            # Near-duplicate inputs (e.g. "Software" vs "Software Development") in the same tone reuse earlier content;
+            # these approximate hits stay in memory and are never written to the exact disk cache
+            embedding = await self.embed_inputs(industry, audience, keywords)
+            if embedding is not None:
+                similar = self._semantic_cache.lookup(tone, embedding)
+                if similar is not None:
+                    logger.info(f"AI content semantic cache hit for {industry}")
+                    return similar
             
-            return json.loads(response.choices[0].message.content)
+            data = orjson.loads(await _call_openai(self._client, body))
+            if not _valid_ai_content(data):
+                logger.error(f"AI content for {industry} is missing required fields; using mock content")
+                return None
+            _ai_cache_set(cache_key, data)
+            if embedding is not None:
+                self._semantic_cache.add(tone, embedding, data)
+            return data
             
         except Exception as e:
             logger.error(f"Error generating AI content: {e}")
-            return self.generate_mock_content_data(business_name, industry, audience, keywords, tone)
+            return None
+
+    async def generate_batch(self, requests: List[Dict], poll_interval: float = 30.0) -> List[str]:
+        """Generate several websites at once, fetching uncached AI content through the OpenAI Batch API"""
+        if not self.mock_mode:
+            try:
+                await self.prefetch_ai_batch(requests, poll_interval)
+            except Exception as e:
+                logger.error(f"Error running OpenAI batch: {e}")
+        # Batch results land in the AI cache, so this only calls the API for items the batch did not cover;
+        # those remaining calls run concurrently, but no more at once than the UI allows, to avoid a burst of 429s
+        limit = asyncio.Semaphore(_GENERATE_CONCURRENCY)
+        
+        async def generate(request):
+            async with limit:
+                return await self.generate_content(**request)
+        
+        return list(await asyncio.gather(*(generate(request) for request in requests)))
+
+    async def prefetch_ai_batch(self, requests: List[Dict], poll_interval: float = 30.0) -> None:
+        """Submit uncached requests as one OpenAI batch and store the parsed results in the AI cache"""
+        # The cache key doubles as custom_id, which also de-duplicates identical requests
+        pending = {}
+        for request in requests:
+            if not _nonblank(request.get('business_name')) or not _nonblank(request.get('industry')):
+                continue
+            cache_key, body = self.build_ai_request(request['industry'], request['audience'], request['keywords'], request['tone'])
+            if not _valid_ai_content(_ai_cache_get(cache_key)):
+                pending[cache_key] = {"custom_id": cache_key, "method": "POST", "url": "/v1/chat/completions", "body": body}
+        if not pending:
+            return
+        
+        jsonl = b"\n".join(orjson.dumps(line) for line in pending.values())
+        batch_file = await self._client.files.create(file=("batch.jsonl", jsonl), purpose="batch")
+        batch = await self._client.batches.create(input_file_id=batch_file.id, endpoint="/v1/chat/completions", completion_window="24h")
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(pending)} requests")
+        
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await self._client.batches.retrieve(batch.id)
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.error(f"OpenAI batch {batch.id} ended with status {batch.status}")
+            return
+        
+        output = await self._client.files.content(batch.output_file_id)
+        for line in output.content.splitlines():
+            result = orjson.loads(line)
+            response = result.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.warning(f"Batch request {result.get('custom_id')} failed: {result.get('error')}")
+                continue
+            try:
+                data = orjson.loads(response["body"]["choices"][0]["message"]["content"])
+            except (KeyError, IndexError, ValueError) as e:
+                logger.warning(f"Could not parse batch result {result.get('custom_id')}: {e}")
+                continue
+            if not _valid_ai_content(data):
+                logger.warning(f"Batch result {result.get('custom_id')} is missing required fields")
+                continue
+            _ai_cache_set(result["custom_id"], data)
 
-    def generate_content(self, business_name: str, industry: str, audience: str, keywords: str, tone: str) -> str:
+    async def generate_content(self, business_name: str, industry: str, audience: str, keywords: str, tone: str) -> str:
         """Main content generation function"""
-        if not business_name.strip():
-            return "❌ Please enter a business name."
-        if not industry.strip():
-            return "❌ Please enter an industry."
+        if not _nonblank(business_name):
+            return _MISSING_BUSINESS_NAME
+        if not _nonblank(industry):
+            return _MISSING_INDUSTRY
+        
+        # In AI mode the content cache key also pins the model, so switching models never serves stale pages
+        content_key = None if self.mock_mode else self.build_ai_request(industry, audience, keywords, tone)[0]
+        year = date.today().year
+        key = (year, content_key, business_name, industry, audience, keywords, tone)
+        cached = _html_cache_get(key)
+        if cached is not None:
+            return cached
         
         logger.info(f"Generating website for {business_name} in {industry}")
         
         try:
-            return self.generate_website_html(business_name, industry, audience, keywords, tone)
+            content_data = None if self.mock_mode else await self._fetch_ai_content_data(industry, audience, keywords, tone)
+            fell_back = content_data is None and not self.mock_mode
+            if content_data is None:
+                content_data = self.generate_mock_content_data(industry, audience, keywords, tone)
+            html_content = self.render_website_html(business_name, industry, keywords, content_data, year)
+            # Only keep pages built from real content, not from the mock fallback after an API error
+            if not fell_back:
+                _html_cache_set(key, html_content)
+            return html_content
         except Exception as e:
             logger.error(f"Error in content generation: {e}")
             return f"❌ Error generating website: {str(e)}"
 
+class _EventStreamAwareGZipResponder(GZipResponder):
+    """GZip responder that passes server-sent event streams through untouched"""
+    async def send_with_gzip(self, message) -> None:
+        await super().send_with_gzip(message)
+        if message["type"] == "http.response.start" and Headers(raw=message["headers"]).get("content-type", "").startswith("text/event-stream"):
+            # Take starlette's pass-through path for already-encoded responses
+            self.content_encoding_set = True
+
+class EventStreamAwareGZipMiddleware(GZipMiddleware):
+    """GZip HTTP responses, but leave Gradio's server-sent event streams alone (starlette would buffer them in the compressor)"""
+    async def __call__(self, scope, receive, send):
+        # Decided from the response Content-Type: clients such as gradio_client do not send Accept: text/event-stream
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("accept-encoding", ""):
+            responder = _EventStreamAwareGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
 # Initialize the content generator
 generator = ContentGenerator()
 
-def generate_website_content(business_name, industry, audience, keywords, tone):
+# Generated pages are written here and served by Gradio (see allowed_paths in launch) instead of inlined in the UI
+_PREVIEW_DIR = Path(tempfile.mkdtemp(prefix="website_preview_"))
+atexit.register(shutil.rmtree, _PREVIEW_DIR, ignore_errors=True)
+
+# Preview files in least-recently-served order; the oldest are deleted so the folder stays bounded
+_PREVIEW_FILES: "OrderedDict[Path, None]" = OrderedDict()
+_PREVIEW_FILES_MAX = 256
+
+def write_preview(html_content: str) -> str:
+    """Write generated HTML to the preview folder and return an iframe pointing at it"""
+    path = _PREVIEW_DIR / f"{hashlib.sha256(html_content.encode()).hexdigest()[:16]}.html"
+    if path in _PREVIEW_FILES:
+        _PREVIEW_FILES.move_to_end(path)
+    else:
+        path.write_text(html_content, encoding="utf-8")
+        _PREVIEW_FILES[path] = None
+        if len(_PREVIEW_FILES) > _PREVIEW_FILES_MAX:
+            _PREVIEW_FILES.popitem(last=False)[0].unlink(missing_ok=True)
+    return f'<iframe src="/file={path}" style="width:100%;height:800px;border:0"></iframe>'
+
+async def generate_website_content(business_name, industry, audience, keywords, tone):
     """Wrapper function for Gradio interface"""
-    return generator.generate_content(business_name, industry, audience, keywords, tone)
+    html_content = await generator.generate_content(business_name, industry, audience, keywords, tone)
+    if html_content.startswith("❌"):
+        return html_content
+    return write_preview(html_content)
+
+# Predefined examples as (business_name, industry, audience, keywords, tone); the default is an empty form
+_DEFAULT_EXAMPLE = ("", "", "", "", "Professional")
+_EXAMPLES = {
+    "Tech Startup": ("InnovateTech Solutions", "Software Development", "Small to medium businesses", "web development, mobile apps, digital transformation", "Professional"),
+    "Local Restaurant": ("Bella Vista Italian Restaurant", "Food & Beverage", "Food lovers and families", "authentic Italian cuisine, family dining, fresh ingredients", "Friendly"),
+    "Fitness Studio": ("Peak Performance Fitness", "Health & Wellness", "Fitness enthusiasts and beginners", "personal training, group classes, fitness goals", "Motivational")
+}
 
 def clear_form():
     """Clear all input fields"""
-    return "", "", "", "", "Professional"
+    return _DEFAULT_EXAMPLE
 
 def load_example(example_name):
     """Load predefined examples"""
-    examples = {
-        "Tech Startup": ("InnovateTech Solutions", "Software Development", "Small to medium businesses", "web development, mobile apps, digital transformation", "Professional"),
-        "Local Restaurant": ("Bella Vista Italian Restaurant", "Food & Beverage", "Food lovers and families", "authentic Italian cuisine, family dining, fresh ingredients", "Friendly"),
-        "Fitness Studio": ("Peak Performance Fitness", "Health & Wellness", "Fitness enthusiasts and beginners", "personal training, group classes, fitness goals", "Motivational")
-    }
-    return examples.get(example_name, ("", "", "", "", "Professional"))
-
-# Create the interface
-with gr.Blocks(title="Website Generator", theme=gr.themes.Soft()) as app:
-    gr.HTML("""
-    <div style="text-align: center; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; margin-bottom: 20px;">
-        <h1>🌐 Professional Website Generator</h1>
-        <p>Generate complete websites with modern UI/UX design</p>
-    </div>
-    """)
-    
-    api_status = "🔑 OpenAI API Connected" if not generator.mock_mode else "⚠️ Mock Mode (Set OPENAI_API_KEY for AI generation)"
-    gr.Markdown(f"**Status:** {api_status}")
+    return _EXAMPLES.get(example_name, _DEFAULT_EXAMPLE)
+
+async def warm_example_cache():
+    """Render the preset examples once so their first click is served from the page cache"""
+    await asyncio.gather(*(generator.generate_content(*example) for example in _EXAMPLES.values()))
+
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-run
+_background_tasks = set()
+
+async def schedule_example_warmup():
+    """Server startup hook: warm the example pages in the background without delaying startup"""
+    task = asyncio.create_task(warm_example_cache())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+# Static UI copy for the generator page
+_HEADER_HTML = '''<div style="text-align: center; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 20px; border-radius: 10px; margin-bottom: 20px;"><h1>🌐 Professional Website Generator</h1><p>Generate complete websites with modern UI/UX design</p></div>'''
+
+_FOOTER_MD = """---
+
+### 📋 Features of Generated Websites:
+✅ **Responsive Design** - Works on all devices  
+✅ **Modern UI/UX** - Clean, professional appearance  
+✅ **SEO Optimized** - Meta tags and structured content  
+✅ **Interactive Elements** - Smooth scrolling, hover effects  
+✅ **Contact Form** - Functional contact form  
+✅ **Professional Sections** - Hero, About, Services, Contact"""
+
+def build_app():
+    """Create the interface; gradio is imported here so importing this module does not pull in the UI stack"""
+    import gradio as gr
     
-    with gr.Row():
-        with gr.Column(scale=1):
-            gr.Markdown("### 📝 Business Information")
-            
-            business_name = gr.Textbox(label="Business Name*", placeholder="Enter your business name")
-            industry = gr.Textbox(label="Industry*", placeholder="e.g., Technology, Healthcare, Retail")
-            audience = gr.Textbox(label="Target Audience", placeholder="e.g., Small business owners", value="General public")
-            keywords = gr.Textbox(label="SEO Keywords", placeholder="Enter comma-separated keywords")
-            tone = gr.Dropdown(
-                label="Tone",
-                choices=["Professional", "Friendly", "Casual", "Formal", "Creative", "Authoritative", "Conversational", "Inspiring", "Motivational"],
-                value="Professional"
-            )
-            
-            with gr.Row():
-                generate_btn = gr.Button("🚀 Generate Website", variant="primary", size="lg")
-                clear_btn = gr.Button("🗑️ Clear Form", variant="secondary")
+    with gr.Blocks(title="Website Generator", theme=gr.themes.Soft()) as app:
+        gr.HTML(_HEADER_HTML)
+        
+        api_status = "🔑 OpenAI API Connected" if not generator.mock_mode else "⚠️ Mock Mode (Set OPENAI_API_KEY for AI generation)"
+        gr.Markdown(f"**Status:** {api_status}")
+        
+        with gr.Row():
+            with gr.Column(scale=1):
+                gr.Markdown("### 📝 Business Information")
+                
+                business_name = gr.Textbox(label="Business Name*", placeholder="Enter your business name")
+                industry = gr.Textbox(label="Industry*", placeholder="e.g., Technology, Healthcare, Retail")
+                audience = gr.Textbox(label="Target Audience", placeholder="e.g., Small business owners", value="General public")
+                keywords = gr.Textbox(label="SEO Keywords", placeholder="Enter comma-separated keywords")
+                tone = gr.Dropdown(
+                    label="Tone",
+                    choices=["Professional", "Friendly", "Casual", "Formal", "Creative", "Authoritative", "Conversational", "Inspiring", "Motivational"],
+                    value="Professional"
+                )
+                
+                with gr.Row():
+                    generate_btn = gr.Button("🚀 Generate Website", variant="primary", size="lg")
+                    clear_btn = gr.Button("🗑️ Clear Form", variant="secondary")
+                
+                gr.Examples(
+                    examples=[list(load_example(name)) for name in _EXAMPLES],
+                    inputs=[business_name, industry, audience, keywords, tone],
+                    label="🚀 Quick Examples"
+                )
             
-            gr.Markdown("### 🚀 Quick Examples")
-            with gr.Row():
-                tech_btn = gr.Button("Tech Startup", size="sm")
-                restaurant_btn = gr.Button("Local Restaurant", size="sm")
-                fitness_btn = gr.Button("Fitness Studio", size="sm")
+            with gr.Column(scale=2):
+                gr.Markdown("### 🌐 Generated Website")
+                output = gr.HTML(
+                    value="<div style='text-align: center; padding: 50px; color: #666;'>Your generated website will appear here...</div>"
+                )
         
-        with gr.Column(scale=2):
-            gr.Markdown("### 🌐 Generated Website")
-            output = gr.HTML(
-                value="<div style='text-align: center; padding: 50px; color: #666;'>Your generated website will appear here...</div>"
-            )
-    
-    gr.Markdown("---")
-    gr.Markdown("""
-    ### 📋 Features of Generated Websites:
-    ✅ **Responsive Design** - Works on all devices  
-    ✅ **Modern UI/UX** - Clean, professional appearance  
-    ✅ **SEO Optimized** - Meta tags and structured content  
-    ✅ **Interactive Elements** - Smooth scrolling, hover effects  
-    ✅ **Contact Form** - Functional contact form  
-    ✅ **Professional Sections** - Hero, About, Services, Contact  
-    """)
+        gr.Markdown(_FOOTER_MD)
+        
+        # Event handlers
+        generate_btn.click(generate_website_content, [business_name, industry, audience, keywords, tone], output, show_progress="minimal", concurrency_limit=_GENERATE_CONCURRENCY)
+        clear_btn.click(clear_form, outputs=[business_name, industry, audience, keywords, tone])
     
-    # Event handlers
-    generate_btn.click(generate_website_content, [business_name, industry, audience, keywords, tone], output)
-    clear_btn.click(clear_form, outputs=[business_name, industry, audience, keywords, tone])
-    tech_btn.click(lambda: load_example("Tech Startup"), outputs=[business_name, industry, audience, keywords, tone])
-    restaurant_btn.click(lambda: load_example("Local Restaurant"), outputs=[business_name, industry, audience, keywords, tone])
-    fitness_btn.click(lambda: load_example("Fitness Studio"), outputs=[business_name, industry, audience, keywords, tone])
+    return app
 
 if __name__ == "__main__":
-    app.launch()
+    app = build_app()
+    app.queue(default_concurrency_limit=_GENERATE_CONCURRENCY, max_size=64).launch(
+        allowed_paths=[str(_PREVIEW_DIR)],
+        show_api=False,
+        app_kwargs={
+            "middleware": [Middleware(EventStreamAwareGZipMiddleware, minimum_size=512)],
+            "on_startup": [schedule_example_warmup]
+        }
+    )